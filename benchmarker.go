@@ -2,6 +2,7 @@ package main
 
 import (
 	"context"
+	"errors"
 	"fmt"
 	"strings"
 	"sync"
@@ -14,6 +15,8 @@ type Benchmarker struct {
 	client  *Client
 	metrics *Metrics
 	display *Display
+	prompts []string
+	output  *resultWriter
 }
 
 // BenchmarkResult holds the final benchmark results
@@ -39,12 +42,15 @@ type BenchmarkResult struct {
 
 // NewBenchmarker creates a new benchmarker instance
 func NewBenchmarker(config Config) *Benchmarker {
-	return &Benchmarker{
+	b := &Benchmarker{
 		config:  config,
 		client:  NewClient(config.ServerURL, config.Timeout, config.APIKey),
 		metrics: NewMetrics(),
 		display: NewDisplay(config.NoColor),
 	}
+	b.prompts = b.getPrompts()
+
+	return b
 }
 
 // Run executes the complete benchmark
@@ -71,22 +77,39 @@ func (b *Benchmarker) Run(ctx context.Context) error {
 	}
 	
 	b.display.PrintHeader(b.config.ServerURL, modelsToTest)
-	
-	var results []BenchmarkResult
-	
-	// Benchmark each model
-	for _, model := range modelsToTest {
-		if ctx.Err() != nil {
-			break
-		}
-		
-		result, err := b.benchmarkModel(ctx, model)
+
+	// Persist results incrementally so an interrupted run keeps
+	// everything finished so far
+	if b.config.Output != "" {
+		writer, err := newResultWriter(b.config.Output)
 		if err != nil {
-			b.display.PrintError(fmt.Sprintf("Failed to benchmark model %s: %v", model, err))
-			continue
+			return fmt.Errorf("failed to open output file: %w", err)
+		}
+		defer writer.Close()
+		b.output = writer
+	}
+
+	var results []BenchmarkResult
+
+	if b.config.ParallelModels && len(modelsToTest) > 1 {
+		// Benchmark all models concurrently
+		results = b.benchmarkModelsParallel(ctx, modelsToTest)
+	} else {
+		// Benchmark each model sequentially
+		for _, model := range modelsToTest {
+			if ctx.Err() != nil {
+				break
+			}
+
+			result, err := b.benchmarkModel(ctx, model)
+			if err != nil {
+				b.display.PrintError(fmt.Sprintf("Failed to benchmark model %s: %v", model, err))
+				continue
+			}
+
+			results = append(results, result)
+			b.recordResult(result)
 		}
-		
-		results = append(results, result)
 	}
 	
 	// Display final results
@@ -97,16 +120,28 @@ func (b *Benchmarker) Run(ctx context.Context) error {
 
 // discoverModels fetches available models from the server
 func (b *Benchmarker) discoverModels(ctx context.Context) error {
+	// Reuse a recent discovery so repeated runs skip the round-trip
+	if !b.config.NoCache {
+		if models := loadCachedModels(b.client.baseURL); models != nil {
+			b.client.availableModels = models
+			b.display.PrintStatus(fmt.Sprintf("Found %d models (cached)", len(models)))
+			return nil
+		}
+	}
+
 	b.display.PrintStatus("Discovering available models...")
-	
+
 	models, err := b.client.ListModels(ctx)
 	if err != nil {
 		return err
 	}
-	
+
 	b.client.availableModels = models
+	if !b.config.NoCache {
+		storeCachedModels(b.client.baseURL, models)
+	}
 	b.display.PrintStatus(fmt.Sprintf("Found %d models", len(models)))
-	
+
 	return nil
 }
 
@@ -173,33 +208,179 @@ func (b *Benchmarker) benchmarkModel(ctx context.Context, model string) (Benchma
 	return result, nil
 }
 
-// findOptimalConcurrency determines the best concurrency level
-func (b *Benchmarker) findOptimalConcurrency(ctx context.Context, model string) (int, error) {
-	b.display.PrintStatus("Using concurrency: 1 (default for cloud APIs)")
-	
-	// For cloud APIs, just use concurrency 1 without any testing
-	// This eliminates the extra failing request that was coming from the test
-	return 1, nil
+// benchmarkModelsParallel benchmarks all models at once, each with its own
+// metrics collector and worker pool. The live progress bar is suppressed since
+// per-model bars would interleave; a status line is printed as each model
+// finishes instead.
+func (b *Benchmarker) benchmarkModelsParallel(ctx context.Context, models []string) []BenchmarkResult {
+	b.display.PrintStatus(fmt.Sprintf("Benchmarking %d models in parallel (duration: %v)...", len(models), b.config.Duration))
+
+	results := make([]BenchmarkResult, len(models))
+
+	var wg sync.WaitGroup
+	for i, model := range models {
+		wg.Add(1)
+		go func(i int, model string) {
+			defer wg.Done()
+
+			// Auto-detection would race across models; default to 1 like cloud APIs
+			concurrency := b.config.Concurrency
+			if concurrency <= 0 {
+				concurrency = 1
+			}
+
+			// Warmup phase with throwaway metrics
+			if b.config.Warmup > 0 {
+				warmupCtx, cancel := context.WithTimeout(ctx, b.config.Warmup)
+				b.runWorkers(warmupCtx, model, concurrency, NewMetrics())
+				cancel()
+			}
+
+			metrics := NewMetrics()
+			benchCtx, cancel := context.WithTimeout(ctx, b.config.Duration)
+			defer cancel()
+
+			b.runWorkers(benchCtx, model, concurrency, metrics)
+
+			stats := metrics.GetStats()
+			results[i] = buildResult(model, stats)
+			b.recordResult(results[i])
+
+			b.display.PrintStatus(fmt.Sprintf("Finished %s (%.2f tokens/sec)", model, stats.TokensPerSec))
+		}(i, model)
+	}
+
+	wg.Wait()
+
+	return results
 }
 
-// testConcurrency runs a short test at a specific concurrency level
-func (b *Benchmarker) testConcurrency(ctx context.Context, model string, concurrency int, duration time.Duration) (float64, error) {
-	tempMetrics := NewMetrics()
-	
-	ctx, cancel := context.WithTimeout(ctx, duration)
-	defer cancel()
-	
+// runWorkers starts concurrency request workers and blocks until the context expires
+func (b *Benchmarker) runWorkers(ctx context.Context, model string, concurrency int, metrics *Metrics) {
+	// The request body for each (model, prompt) pair never changes,
+	// so encode all of them once instead of per request
+	bodies, err := b.prepareBodies(model)
+	if err != nil {
+		b.display.PrintError(fmt.Sprintf("Failed to prepare requests for model %s: %v", model, err))
+		return
+	}
+
 	var wg sync.WaitGroup
 	for i := 0; i < concurrency; i++ {
 		wg.Add(1)
 		go func() {
 			defer wg.Done()
-			b.worker(ctx, model, tempMetrics)
+			b.worker(ctx, bodies, metrics)
 		}()
 	}
-	
+
 	wg.Wait()
+}
+
+// prepareBodies pre-encodes the completion request for every prompt
+func (b *Benchmarker) prepareBodies(model string) ([][]byte, error) {
+	bodies := make([][]byte, len(b.prompts))
+	for i, prompt := range b.prompts {
+		body, err := b.client.PrepareCompletionBody(model, prompt, b.config.Streaming)
+		if err != nil {
+			return nil, err
+		}
+		bodies[i] = body
+	}
+
+	return bodies, nil
+}
+
+// recordResult appends a finished result to the output file, if configured
+func (b *Benchmarker) recordResult(result BenchmarkResult) {
+	if b.output == nil {
+		return
+	}
+
+	if err := b.output.Write(result); err != nil {
+		b.display.PrintError(fmt.Sprintf("Failed to write result: %v", err))
+	}
+}
+
+// buildResult converts calculated statistics into a BenchmarkResult
+func buildResult(model string, stats MetricsStats) BenchmarkResult {
+	return BenchmarkResult{
+		Model:              model,
+		Duration:           stats.Duration,
+		TotalRequests:      stats.TotalRequests,
+		SuccessfulReqs:     stats.SuccessfulRequests,
+		FailedReqs:         stats.FailedRequests,
+		RequestsPerSec:     stats.RequestsPerSec,
+		TokensPerSec:       stats.TokensPerSec,
+		InputTokensPerSec:  stats.InputTokensPerSec,
+		OutputTokensPerSec: stats.OutputTokensPerSec,
+		AvgLatency:         stats.AvgLatency,
+		MinLatency:         stats.MinLatency,
+		MaxLatency:         stats.MaxLatency,
+		P95Latency:         stats.P95Latency,
+		P99Latency:         stats.P99Latency,
+		AvgTTFT:           stats.AvgTTFT,
+		ErrorRate:         stats.ErrorRate,
+		Errors:            stats.Errors,
+	}
+}
+
+// findOptimalConcurrency determines the best concurrency level by probing
+// doubling worker counts and keeping the last level that still improved
+// throughput meaningfully
+func (b *Benchmarker) findOptimalConcurrency(ctx context.Context, model string) (int, error) {
+	const (
+		probeDuration  = 5 * time.Second
+		maxConcurrency = 16
+		minImprovement = 1.10 // require a 10% RPS gain to justify doubling
+	)
+
+	b.display.PrintStatus("Auto-detecting concurrency...")
+
+	best := 1
+	bestRPS := 0.0
+
+	for c := 1; c <= maxConcurrency; c *= 2 {
+		if ctx.Err() != nil {
+			break
+		}
+
+		rps, err := b.testConcurrency(ctx, model, c, probeDuration)
+		if err != nil {
+			return best, err
+		}
+
+		if c == 1 {
+			bestRPS = rps
+			if rps <= 0 {
+				// Server isn't completing requests; don't pile on more workers
+				break
+			}
+			continue
+		}
+
+		if rps < bestRPS*minImprovement {
+			break
+		}
+
+		best = c
+		bestRPS = rps
+	}
+
+	b.display.PrintStatus(fmt.Sprintf("Using concurrency: %d (%.2f req/s during probe)", best, bestRPS))
+
+	return best, nil
+}
+
+// testConcurrency runs a short test at a specific concurrency level
+func (b *Benchmarker) testConcurrency(ctx context.Context, model string, concurrency int, duration time.Duration) (float64, error) {
+	tempMetrics := NewMetrics()
 	
+	ctx, cancel := context.WithTimeout(ctx, duration)
+	defer cancel()
+
+	b.runWorkers(ctx, model, concurrency, tempMetrics)
+
 	stats := tempMetrics.GetStats()
 	return stats.RequestsPerSec, nil
 }
@@ -210,19 +391,10 @@ func (b *Benchmarker) warmup(ctx context.Context, model string, concurrency int)
 	
 	ctx, cancel := context.WithTimeout(ctx, b.config.Warmup)
 	defer cancel()
-	
-	var wg sync.WaitGroup
-	for i := 0; i < concurrency; i++ {
-		wg.Add(1)
-		go func() {
-			defer wg.Done()
-			// Use a throwaway metrics instance for warmup
-			warmupMetrics := NewMetrics()
-			b.worker(ctx, model, warmupMetrics)
-		}()
-	}
-	
-	wg.Wait()
+
+	// Use a throwaway metrics instance for warmup
+	b.runWorkers(ctx, model, concurrency, NewMetrics())
+
 	return nil
 }
 
@@ -243,113 +415,97 @@ func (b *Benchmarker) runMainBenchmark(ctx context.Context, model string, concur
 	// Run benchmark workers
 	benchCtx, benchCancel := context.WithTimeout(ctx, b.config.Duration)
 	defer benchCancel()
-	
-	var wg sync.WaitGroup
-	for i := 0; i < concurrency; i++ {
-		wg.Add(1)
-		go func() {
-			defer wg.Done()
-			b.worker(benchCtx, model, b.metrics)
-		}()
-	}
-	
-	wg.Wait()
-	
+
+	b.runWorkers(benchCtx, model, concurrency, b.metrics)
+
 	// Cancel progress context and wait for it to finish
 	progressCancel()
 	<-progressDone
-	
+
 	// Get final stats
 	stats := b.metrics.GetStats()
-	
-	return BenchmarkResult{
-		Model:              model,
-		Duration:           stats.Duration,
-		TotalRequests:      stats.TotalRequests,
-		SuccessfulReqs:     stats.SuccessfulRequests,
-		FailedReqs:         stats.FailedRequests,
-		RequestsPerSec:     stats.RequestsPerSec,
-		TokensPerSec:       stats.TokensPerSec,
-		InputTokensPerSec:  stats.InputTokensPerSec,
-		OutputTokensPerSec: stats.OutputTokensPerSec,
-		AvgLatency:         stats.AvgLatency,
-		MinLatency:         stats.MinLatency,
-		MaxLatency:         stats.MaxLatency,
-		P95Latency:         stats.P95Latency,
-		P99Latency:         stats.P99Latency,
-		AvgTTFT:           stats.AvgTTFT,
-		ErrorRate:         stats.ErrorRate,
-		Errors:            stats.Errors,
-	}, nil
+
+	return buildResult(model, stats), nil
 }
 
-// worker runs continuous requests until context is cancelled
-func (b *Benchmarker) worker(ctx context.Context, model string, metrics *Metrics) {
-	prompts := b.getPrompts()
+// worker runs continuous requests until context is cancelled, cycling
+// through the pre-encoded request bodies
+func (b *Benchmarker) worker(ctx context.Context, bodies [][]byte, metrics *Metrics) {
 	promptIndex := 0
-	
+
 	for {
 		select {
 		case <-ctx.Done():
 			return
 		default:
-			prompt := prompts[promptIndex%len(prompts)]
+			i := promptIndex % len(bodies)
 			promptIndex++
-			
+
 			var resp *CompletionResponse
 			var err error
-			
+
 			if b.config.Streaming {
-				resp, err = b.client.CreateStreamingCompletion(ctx, model, prompt)
+				resp, err = b.client.CreateStreamingCompletionFromBody(ctx, bodies[i], b.prompts[i])
 			} else {
-				resp, err = b.client.CreateCompletion(ctx, model, prompt)
+				resp, err = b.client.CreateCompletionFromBody(ctx, bodies[i])
 			}
 			
 			metrics.RecordRequest(resp, err)
+
+			// Back off for as long as the server asked instead of
+			// hammering it in a tight retry loop
+			var rateLimited *rateLimitError
+			if errors.As(err, &rateLimited) {
+				wait := rateLimited.retryAfter
+				if wait > 30*time.Second {
+					wait = 30 * time.Second
+				}
+				select {
+				case <-ctx.Done():
+					return
+				case <-time.After(wait):
+				}
+			}
 		}
 	}
 }
 
-// getPrompts returns test prompts based on configured size
-func (b *Benchmarker) getPrompts() []string {
-	prompts := make(map[string][]string)
-	
-	prompts["small"] = []string{
+// testPrompts holds the prompt sets by size, built once at startup
+// instead of per worker
+var testPrompts = map[string][]string{
+	"small": {
 		"Hello, world!",
 		"What is 2+2?",
 		"Tell me a joke.",
 		"How are you?",
 		"What's the weather like?",
-	}
-	
-	prompts["medium"] = []string{
+	},
+	"medium": {
 		"Write a short story about a robot learning to paint.",
 		"Explain the concept of recursion in programming with an example.",
 		"What are the main differences between renewable and non-renewable energy sources?",
 		"Describe the process of photosynthesis in plants.",
 		"How does machine learning differ from traditional programming approaches?",
-	}
-	
-	prompts["large"] = []string{
+	},
+	"large": {
 		"You are a senior software engineer reviewing a pull request. The code implements a distributed cache system using Redis. Please provide a comprehensive code review covering architecture, performance, security, error handling, testing, and maintainability. Consider scalability concerns and suggest improvements for monitoring and observability. The system needs to handle 100,000 requests per second with sub-millisecond latency requirements.",
 		"Write a detailed technical specification for a real-time collaborative document editing system similar to Google Docs. Include the architecture design, data structures, conflict resolution algorithms, network protocols, security considerations, user authentication, permission management, and scalability strategies. Explain how you would handle concurrent edits, maintain consistency across multiple clients, and ensure data persistence.",
 		"Design a comprehensive monitoring and alerting system for a microservices architecture running on Kubernetes. The system should handle metrics collection, log aggregation, distributed tracing, anomaly detection, and automated incident response. Explain the technology stack, data flow, storage requirements, query optimization, dashboard design, and integration with existing DevOps tools.",
-	}
-	
+	},
+}
+
+// getPrompts returns test prompts based on configured size
+func (b *Benchmarker) getPrompts() []string {
 	switch b.config.PromptSize {
-	case "small":
-		return prompts["small"]
-	case "medium":
-		return prompts["medium"]
-	case "large":
-		return prompts["large"]
+	case "small", "medium", "large":
+		return testPrompts[b.config.PromptSize]
 	case "all":
 		var all []string
-		for _, p := range prompts {
+		for _, p := range testPrompts {
 			all = append(all, p...)
 		}
 		return all
 	default:
-		return prompts["medium"]
+		return testPrompts["medium"]
 	}
 }
\ No newline at end of file
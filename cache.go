@@ -0,0 +1,78 @@
+package main
+
+import (
+	"crypto/sha256"
+	"encoding/hex"
+	"encoding/json"
+	"os"
+	"path/filepath"
+	"time"
+)
+
+// modelCacheTTL controls how long a discovered model list stays fresh
+const modelCacheTTL = 1 * time.Hour
+
+// modelCacheEntry is the on-disk format for a cached model discovery
+type modelCacheEntry struct {
+	FetchedAt time.Time `json:"fetched_at"`
+	Models    []Model   `json:"models"`
+}
+
+// modelCachePath returns the cache file path for a server URL
+func modelCachePath(serverURL string) (string, error) {
+	dir, err := os.UserCacheDir()
+	if err != nil {
+		return "", err
+	}
+
+	sum := sha256.Sum256([]byte(serverURL))
+	return filepath.Join(dir, "aibench", "models-"+hex.EncodeToString(sum[:8])+".json"), nil
+}
+
+// loadCachedModels returns the cached model list for a server,
+// or nil when the cache is missing or stale
+func loadCachedModels(serverURL string) []Model {
+	path, err := modelCachePath(serverURL)
+	if err != nil {
+		return nil
+	}
+
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return nil
+	}
+
+	var entry modelCacheEntry
+	if err := json.Unmarshal(data, &entry); err != nil {
+		return nil
+	}
+
+	if time.Since(entry.FetchedAt) > modelCacheTTL {
+		return nil
+	}
+
+	return entry.Models
+}
+
+// storeCachedModels persists the model list for later runs.
+// Failures are ignored since the cache is purely an optimization.
+func storeCachedModels(serverURL string, models []Model) {
+	path, err := modelCachePath(serverURL)
+	if err != nil {
+		return
+	}
+
+	if err := os.MkdirAll(filepath.Dir(path), 0755); err != nil {
+		return
+	}
+
+	data, err := json.Marshal(modelCacheEntry{
+		FetchedAt: time.Now(),
+		Models:    models,
+	})
+	if err != nil {
+		return
+	}
+
+	os.WriteFile(path, data, 0644)
+}
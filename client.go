@@ -11,16 +11,21 @@ import (
 	"net/http"
 	"net/url"
 	"os"
+	"strconv"
 	"strings"
+	"sync"
 	"time"
 )
 
 // Client handles OpenAI API interactions
 type Client struct {
 	baseURL         string
+	completionsURL  string
+	modelsURL       string
+	authHeader      string
 	httpClient      *http.Client
 	availableModels []Model
-	apiKey          string
+	modelsMu        sync.Mutex // single-flights discovery and guards availableModels
 }
 
 // Model represents an OpenAI model
@@ -39,11 +44,17 @@ type ModelsResponse struct {
 
 // CompletionRequest represents a chat completion request
 type CompletionRequest struct {
-	Model       string    `json:"model"`
-	Messages    []Message `json:"messages"`
-	MaxTokens   int       `json:"max_tokens,omitempty"`
-	Temperature float64   `json:"temperature,omitempty"`
-	Stream      bool      `json:"stream,omitempty"`
+	Model         string         `json:"model"`
+	Messages      []Message      `json:"messages"`
+	MaxTokens     int            `json:"max_tokens,omitempty"`
+	Temperature   float64        `json:"temperature,omitempty"`
+	Stream        bool           `json:"stream,omitempty"`
+	StreamOptions *StreamOptions `json:"stream_options,omitempty"`
+}
+
+// StreamOptions controls streaming behavior
+type StreamOptions struct {
+	IncludeUsage bool `json:"include_usage"`
 }
 
 // Message represents a chat message
@@ -60,7 +71,9 @@ type CompletionResponse struct {
 	Model   string   `json:"model"`
 	Choices []Choice `json:"choices"`
 	Usage   Usage    `json:"usage"`
-	// Timing information (not from API, added by client)
+	// Timing information (not from API, added by client). time.Now()
+	// embeds a monotonic clock reading, so latencies derived from these
+	// via Sub are immune to wall-clock (NTP) adjustments.
 	RequestTime  time.Time
 	ResponseTime time.Time
 	TTFT         time.Duration // Time to first token (for streaming)
@@ -88,6 +101,39 @@ type StreamResponse struct {
 	Created int64    `json:"created"`
 	Model   string   `json:"model"`
 	Choices []Choice `json:"choices"`
+	Usage   *Usage   `json:"usage,omitempty"`
+}
+
+// rateLimitError reports a 429 response along with how long the server
+// asked us to wait before retrying
+type rateLimitError struct {
+	retryAfter time.Duration
+}
+
+func (e *rateLimitError) Error() string {
+	return fmt.Sprintf("rate limited (retry after %v)", e.retryAfter)
+}
+
+// parseRetryAfter reads the Retry-After header, defaulting to one second
+// when the server does not say how long to back off
+func parseRetryAfter(resp *http.Response) time.Duration {
+	if v := resp.Header.Get("Retry-After"); v != "" {
+		if secs, err := strconv.Atoi(v); err == nil && secs > 0 {
+			return time.Duration(secs) * time.Second
+		}
+		if t, err := http.ParseTime(v); err == nil {
+			if d := time.Until(t); d > 0 {
+				return d
+			}
+		}
+	}
+	return time.Second
+}
+
+// estimateTokens approximates the token count of a string at ~4 chars/token.
+// Only used when the server does not report exact usage.
+func estimateTokens(s string) int {
+	return len(s) / 4
 }
 
 // isIPAddress checks if a string looks like an IP address (with optional port)
@@ -137,40 +183,76 @@ func NewClient(serverURL string, timeout time.Duration, apiKey string) *Client {
 		apiKey = os.Getenv("OPENAI_API_KEY")
 	}
 	
+	// Pre-build the endpoint URLs and auth header once instead of
+	// re-deriving them on every request
+	apiBase := serverURL
+	if !strings.Contains(apiBase, "/v1") {
+		apiBase += "/v1"
+	}
+
+	authHeader := ""
+	if apiKey != "" {
+		authHeader = "Bearer " + apiKey
+	}
+
 	return &Client{
-		baseURL: serverURL,
-		apiKey:  apiKey,
+		baseURL:        serverURL,
+		completionsURL: apiBase + "/chat/completions",
+		modelsURL:      apiBase + "/models",
+		authHeader:     authHeader,
 		httpClient: &http.Client{
 			Timeout: timeout,
 			Transport: &http.Transport{
-				MaxIdleConns:        100,
-				MaxIdleConnsPerHost: 10,
-				IdleConnTimeout:     30 * time.Second,
+				// Bound connection setup separately from the overall
+				// request timeout, keep established TCP connections
+				// alive, and fall back from broken IPv6 quickly so a
+				// stalled handshake can't eat the whole request budget
+				DialContext: (&net.Dialer{
+					Timeout:       5 * time.Second,
+					KeepAlive:     30 * time.Second,
+					FallbackDelay: 250 * time.Millisecond,
+				}).DialContext,
+				TLSHandshakeTimeout: 10 * time.Second,
+				// A custom Transport opts out of net/http's automatic
+				// HTTP/2 support; force the ALPN attempt so HTTPS
+				// servers that speak h2 multiplex concurrent requests
+				// over one connection. HTTP/1.1-only servers are
+				// unaffected.
+				ForceAttemptHTTP2: true,
+				// Keep enough idle connections warm for the highest
+				// concurrency levels so every request after the first
+				// reuses an established TCP+TLS connection instead of
+				// paying a fresh handshake.
+				MaxIdleConns:        64,
+				MaxIdleConnsPerHost: 16,
+				MaxConnsPerHost:     32,
+				IdleConnTimeout:     75 * time.Second,
 			},
 		},
 	}
 }
 
-// ListModels fetches available models from the server
+// ListModels fetches available models from the server. Concurrent and
+// repeated calls are coalesced: the first caller performs the fetch and
+// everyone else reuses its result.
 func (c *Client) ListModels(ctx context.Context) ([]Model, error) {
-	// Handle URLs that already contain versioned paths
-	var url string
-	if strings.Contains(c.baseURL, "/v1") {
-		url = c.baseURL + "/models"
-	} else {
-		url = c.baseURL + "/v1/models"
+	c.modelsMu.Lock()
+	defer c.modelsMu.Unlock()
+
+	if c.availableModels != nil {
+		return c.availableModels, nil
 	}
-	
-	req, err := http.NewRequestWithContext(ctx, "GET", url, nil)
+
+	req, err := http.NewRequestWithContext(ctx, "GET", c.modelsURL, nil)
 	if err != nil {
 		return nil, fmt.Errorf("failed to create request: %w", err)
 	}
-	
+
 	req.Header.Set("Content-Type", "application/json")
-	
+
 	// Add API key if available
-	if c.apiKey != "" {
-		req.Header.Set("Authorization", "Bearer "+c.apiKey)
+	if c.authHeader != "" {
+		req.Header.Set("Authorization", c.authHeader)
 	}
 	
 	resp, err := c.httpClient.Do(req)
@@ -188,12 +270,15 @@ func (c *Client) ListModels(ctx context.Context) ([]Model, error) {
 	if err := json.NewDecoder(resp.Body).Decode(&modelsResp); err != nil {
 		return nil, fmt.Errorf("failed to decode response: %w", err)
 	}
-	
+
+	c.availableModels = modelsResp.Data
+
 	return modelsResp.Data, nil
 }
 
-// CreateCompletion creates a non-streaming completion
-func (c *Client) CreateCompletion(ctx context.Context, model, prompt string) (*CompletionResponse, error) {
+// PrepareCompletionBody encodes a completion request once so callers issuing
+// the same request repeatedly can reuse the bytes instead of re-marshaling
+func (c *Client) PrepareCompletionBody(model, prompt string, stream bool) ([]byte, error) {
 	reqBody := CompletionRequest{
 		Model: model,
 		Messages: []Message{
@@ -201,53 +286,68 @@ func (c *Client) CreateCompletion(ctx context.Context, model, prompt string) (*C
 		},
 		MaxTokens:   150,
 		Temperature: 0.7,
-		Stream:      false,
+		Stream:      stream,
 	}
-	
-	return c.makeCompletionRequest(ctx, reqBody)
+	if stream {
+		// Ask the server for exact token counts in the final chunk
+		reqBody.StreamOptions = &StreamOptions{IncludeUsage: true}
+	}
+
+	jsonBody, err := json.Marshal(reqBody)
+	if err != nil {
+		return nil, fmt.Errorf("failed to marshal request: %w", err)
+	}
+
+	return jsonBody, nil
+}
+
+// CreateCompletion creates a non-streaming completion
+func (c *Client) CreateCompletion(ctx context.Context, model, prompt string) (*CompletionResponse, error) {
+	jsonBody, err := c.PrepareCompletionBody(model, prompt, false)
+	if err != nil {
+		return nil, err
+	}
+
+	return c.makeCompletionRequest(ctx, jsonBody)
+}
+
+// CreateCompletionFromBody creates a non-streaming completion from a
+// pre-encoded request body
+func (c *Client) CreateCompletionFromBody(ctx context.Context, jsonBody []byte) (*CompletionResponse, error) {
+	return c.makeCompletionRequest(ctx, jsonBody)
 }
 
 // CreateStreamingCompletion creates a streaming completion
 func (c *Client) CreateStreamingCompletion(ctx context.Context, model, prompt string) (*CompletionResponse, error) {
-	reqBody := CompletionRequest{
-		Model: model,
-		Messages: []Message{
-			{Role: "user", Content: prompt},
-		},
-		MaxTokens:   150,
-		Temperature: 0.7,
-		Stream:      true,
+	jsonBody, err := c.PrepareCompletionBody(model, prompt, true)
+	if err != nil {
+		return nil, err
 	}
-	
-	return c.makeStreamingRequest(ctx, reqBody)
+
+	return c.makeStreamingRequest(ctx, jsonBody, prompt)
+}
+
+// CreateStreamingCompletionFromBody creates a streaming completion from a
+// pre-encoded request body. The prompt is still needed for the fallback
+// token estimate when the server reports no usage.
+func (c *Client) CreateStreamingCompletionFromBody(ctx context.Context, jsonBody []byte, prompt string) (*CompletionResponse, error) {
+	return c.makeStreamingRequest(ctx, jsonBody, prompt)
 }
 
 // makeCompletionRequest handles non-streaming requests
-func (c *Client) makeCompletionRequest(ctx context.Context, reqBody CompletionRequest) (*CompletionResponse, error) {
-	jsonBody, err := json.Marshal(reqBody)
-	if err != nil {
-		return nil, fmt.Errorf("failed to marshal request: %w", err)
-	}
-	
-	// Handle URLs that already contain versioned paths
-	var url string
-	if strings.Contains(c.baseURL, "/v1") {
-		url = c.baseURL + "/chat/completions"
-	} else {
-		url = c.baseURL + "/v1/chat/completions"
-	}
-	req, err := http.NewRequestWithContext(ctx, "POST", url, bytes.NewBuffer(jsonBody))
+func (c *Client) makeCompletionRequest(ctx context.Context, jsonBody []byte) (*CompletionResponse, error) {
+	req, err := http.NewRequestWithContext(ctx, "POST", c.completionsURL, bytes.NewReader(jsonBody))
 	if err != nil {
 		return nil, fmt.Errorf("failed to create request: %w", err)
 	}
-	
+
 	req.Header.Set("Content-Type", "application/json")
-	
+
 	// Add API key if available
-	if c.apiKey != "" {
-		req.Header.Set("Authorization", "Bearer "+c.apiKey)
+	if c.authHeader != "" {
+		req.Header.Set("Authorization", c.authHeader)
 	}
-	
+
 	requestTime := time.Now()
 	resp, err := c.httpClient.Do(req)
 	if err != nil {
@@ -256,12 +356,17 @@ func (c *Client) makeCompletionRequest(ctx context.Context, reqBody CompletionRe
 	defer resp.Body.Close()
 	
 	responseTime := time.Now()
-	
+
+	if resp.StatusCode == http.StatusTooManyRequests {
+		io.Copy(io.Discard, resp.Body)
+		return nil, &rateLimitError{retryAfter: parseRetryAfter(resp)}
+	}
+
 	if resp.StatusCode != http.StatusOK {
 		body, _ := io.ReadAll(resp.Body)
 		return nil, fmt.Errorf("API error %d: %s", resp.StatusCode, string(body))
 	}
-	
+
 	var completion CompletionResponse
 	if err := json.NewDecoder(resp.Body).Decode(&completion); err != nil {
 		return nil, fmt.Errorf("failed to decode response: %w", err)
@@ -274,29 +379,17 @@ func (c *Client) makeCompletionRequest(ctx context.Context, reqBody CompletionRe
 }
 
 // makeStreamingRequest handles streaming requests
-func (c *Client) makeStreamingRequest(ctx context.Context, reqBody CompletionRequest) (*CompletionResponse, error) {
-	jsonBody, err := json.Marshal(reqBody)
-	if err != nil {
-		return nil, fmt.Errorf("failed to marshal request: %w", err)
-	}
-	
-	// Handle URLs that already contain versioned paths
-	var url string
-	if strings.Contains(c.baseURL, "/v1") {
-		url = c.baseURL + "/chat/completions"
-	} else {
-		url = c.baseURL + "/v1/chat/completions"
-	}
-	req, err := http.NewRequestWithContext(ctx, "POST", url, bytes.NewBuffer(jsonBody))
+func (c *Client) makeStreamingRequest(ctx context.Context, jsonBody []byte, prompt string) (*CompletionResponse, error) {
+	req, err := http.NewRequestWithContext(ctx, "POST", c.completionsURL, bytes.NewReader(jsonBody))
 	if err != nil {
 		return nil, fmt.Errorf("failed to create request: %w", err)
 	}
-	
+
 	req.Header.Set("Content-Type", "application/json")
-	
+
 	// Add API key if available
-	if c.apiKey != "" {
-		req.Header.Set("Authorization", "Bearer "+c.apiKey)
+	if c.authHeader != "" {
+		req.Header.Set("Authorization", c.authHeader)
 	}
 	req.Header.Set("Accept", "text/event-stream")
 	
@@ -307,13 +400,18 @@ func (c *Client) makeStreamingRequest(ctx context.Context, reqBody CompletionReq
 	}
 	defer resp.Body.Close()
 	
+	if resp.StatusCode == http.StatusTooManyRequests {
+		io.Copy(io.Discard, resp.Body)
+		return nil, &rateLimitError{retryAfter: parseRetryAfter(resp)}
+	}
+
 	if resp.StatusCode != http.StatusOK {
 		body, _ := io.ReadAll(resp.Body)
 		return nil, fmt.Errorf("API error %d: %s", resp.StatusCode, string(body))
 	}
-	
+
 	// Process streaming response
-	completion, err := c.processStreamingResponse(resp.Body, requestTime)
+	completion, err := c.processStreamingResponse(resp.Body, prompt, requestTime)
 	if err != nil {
 		return nil, err
 	}
@@ -321,35 +419,47 @@ func (c *Client) makeStreamingRequest(ctx context.Context, reqBody CompletionReq
 	return completion, nil
 }
 
+// SSE framing markers, kept as byte slices so the stream loop never
+// round-trips each line through a string
+var (
+	ssePrefix = []byte("data: ")
+	sseDone   = []byte("[DONE]")
+)
+
 // processStreamingResponse processes the SSE stream and returns a complete response
-func (c *Client) processStreamingResponse(body io.Reader, requestTime time.Time) (*CompletionResponse, error) {
+func (c *Client) processStreamingResponse(body io.Reader, prompt string, requestTime time.Time) (*CompletionResponse, error) {
 	scanner := bufio.NewScanner(body)
-	
+	// SSE data lines scale with chunk size, not token size: give the
+	// scanner a roomy initial buffer and allow growth past bufio's 64KB
+	// default so a large frame doesn't abort the stream mid-response
+	scanner.Buffer(make([]byte, 0, 64*1024), 1024*1024)
+
 	var completion CompletionResponse
-	var content strings.Builder
+	var contentLen int
 	var firstTokenTime time.Time
 	var lastChunk *StreamResponse
-	
+	var usage *Usage
+
 	completion.RequestTime = requestTime
 	
 	for scanner.Scan() {
-		line := scanner.Text()
-		
+		line := scanner.Bytes()
+
 		// Skip empty lines and non-data lines
-		if !strings.HasPrefix(line, "data: ") {
+		if !bytes.HasPrefix(line, ssePrefix) {
 			continue
 		}
-		
-		// Extract JSON data
-		data := strings.TrimPrefix(line, "data: ")
-		
+
+		// Extract JSON data without copying the line into a string
+		data := line[len(ssePrefix):]
+
 		// Check for end of stream
-		if data == "[DONE]" {
+		if bytes.Equal(data, sseDone) {
 			break
 		}
-		
+
 		var chunk StreamResponse
-		if err := json.Unmarshal([]byte(data), &chunk); err != nil {
+		if err := json.Unmarshal(data, &chunk); err != nil {
 			continue // Skip malformed chunks
 		}
 		
@@ -359,11 +469,17 @@ func (c *Client) processStreamingResponse(body io.Reader, requestTime time.Time)
 			completion.TTFT = firstTokenTime.Sub(requestTime)
 		}
 		
-		// Accumulate content
+		// Track content length only; nothing downstream reads the text,
+		// so retaining the full completion would just hold memory
 		if len(chunk.Choices) > 0 && chunk.Choices[0].Delta.Content != "" {
-			content.WriteString(chunk.Choices[0].Delta.Content)
+			contentLen += len(chunk.Choices[0].Delta.Content)
 		}
-		
+
+		// Servers that support it report exact token counts in the final chunk
+		if chunk.Usage != nil {
+			usage = chunk.Usage
+		}
+
 		lastChunk = &chunk
 	}
 	
@@ -383,20 +499,23 @@ func (c *Client) processStreamingResponse(body io.Reader, requestTime time.Time)
 			{
 				Index: 0,
 				Message: Message{
-					Role:    "assistant",
-					Content: content.String(),
+					Role: "assistant",
 				},
 				FinishReason: "stop",
 			},
 		}
-		
-		// Estimate token usage (rough approximation)
-		promptTokens := len(strings.Fields(completion.Choices[0].Message.Content)) / 4
-		completionTokens := len(strings.Fields(content.String())) / 4
-		completion.Usage = Usage{
-			PromptTokens:     promptTokens,
-			CompletionTokens: completionTokens,
-			TotalTokens:      promptTokens + completionTokens,
+
+		// Prefer exact server-reported usage; otherwise estimate at ~4 chars/token
+		if usage != nil {
+			completion.Usage = *usage
+		} else {
+			promptTokens := estimateTokens(prompt)
+			completionTokens := contentLen / 4
+			completion.Usage = Usage{
+				PromptTokens:     promptTokens,
+				CompletionTokens: completionTokens,
+				TotalTokens:      promptTokens + completionTokens,
+			}
 		}
 	}
 	
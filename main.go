@@ -26,6 +26,9 @@ type Config struct {
 	NoColor      bool
 	APIKey       string
 	SkipDiscovery bool
+	ParallelModels bool
+	NoCache      bool
+	Output       string
 }
 
 var config Config
@@ -53,6 +56,9 @@ func init() {
 	rootCmd.Flags().BoolVar(&config.NoColor, "no-color", false, "Disable colored output")
 	rootCmd.Flags().StringVarP(&config.APIKey, "api-key", "k", "", "API key (or use OPENAI_API_KEY env var)")
 	rootCmd.Flags().BoolVar(&config.SkipDiscovery, "skip-discovery", false, "Skip model discovery, use specified models directly")
+	rootCmd.Flags().BoolVar(&config.ParallelModels, "parallel-models", false, "Benchmark all models concurrently instead of one at a time")
+	rootCmd.Flags().BoolVar(&config.NoCache, "no-cache", false, "Skip the on-disk model discovery cache")
+	rootCmd.Flags().StringVarP(&config.Output, "output", "o", "", "Append results to a file as JSON lines, one per model as it finishes")
 }
 
 func runBenchmark(cmd *cobra.Command, args []string) error {
@@ -12,8 +12,8 @@ type Metrics struct {
 	startTime           time.Time
 	requestTimes        []time.Duration
 	ttftTimes           []time.Duration
-	inputTokens         []int
-	outputTokens        []int
+	totalInputTokens    int
+	totalOutputTokens   int
 	totalRequests       int64
 	successfulRequests  int64
 	failedRequests      int64
@@ -43,8 +43,10 @@ type MetricsStats struct {
 // NewMetrics creates a new metrics collector
 func NewMetrics() *Metrics {
 	return &Metrics{
-		startTime: time.Now(),
-		errors:    make(map[string]int),
+		startTime:    time.Now(),
+		requestTimes: make([]time.Duration, 0, 1024),
+		ttftTimes:    make([]time.Duration, 0, 1024),
+		errors:       make(map[string]int),
 	}
 }
 
@@ -54,10 +56,12 @@ func (m *Metrics) Reset() {
 	defer m.mu.Unlock()
 	
 	m.startTime = time.Now()
-	m.requestTimes = nil
-	m.ttftTimes = nil
-	m.inputTokens = nil
-	m.outputTokens = nil
+	// Keep the allocated capacity so the next model's samples
+	// don't re-grow the slices from scratch
+	m.requestTimes = m.requestTimes[:0]
+	m.ttftTimes = m.ttftTimes[:0]
+	m.totalInputTokens = 0
+	m.totalOutputTokens = 0
 	m.totalRequests = 0
 	m.successfulRequests = 0
 	m.failedRequests = 0
@@ -99,9 +103,9 @@ func (m *Metrics) RecordRequest(resp *CompletionResponse, err error) {
 		m.ttftTimes = append(m.ttftTimes, resp.TTFT)
 	}
 	
-	// Record token counts
-	m.inputTokens = append(m.inputTokens, resp.Usage.PromptTokens)
-	m.outputTokens = append(m.outputTokens, resp.Usage.CompletionTokens)
+	// Record token counts as running totals so rate queries stay O(1)
+	m.totalInputTokens += resp.Usage.PromptTokens
+	m.totalOutputTokens += resp.Usage.CompletionTokens
 }
 
 // GetStats calculates and returns current statistics
@@ -134,13 +138,33 @@ func (m *Metrics) GetStats() MetricsStats {
 		stats.RequestsPerSec = float64(m.successfulRequests) / duration.Seconds()
 	}
 	
-	// Calculate token rates and latency stats
+	// Calculate latency stats: avg/min/max in a single pass, then one
+	// sorted copy shared by both percentiles
 	if len(m.requestTimes) > 0 {
-		stats.AvgLatency = m.calculateAverage(m.requestTimes)
-		stats.MinLatency = m.calculateMin(m.requestTimes)
-		stats.MaxLatency = m.calculateMax(m.requestTimes)
-		stats.P95Latency = m.calculatePercentile(m.requestTimes, 95)
-		stats.P99Latency = m.calculatePercentile(m.requestTimes, 99)
+		var total int64
+		min, max := m.requestTimes[0], m.requestTimes[0]
+		for _, d := range m.requestTimes {
+			total += int64(d)
+			if d < min {
+				min = d
+			}
+			if d > max {
+				max = d
+			}
+		}
+
+		stats.AvgLatency = time.Duration(total / int64(len(m.requestTimes)))
+		stats.MinLatency = min
+		stats.MaxLatency = max
+
+		sorted := make([]time.Duration, len(m.requestTimes))
+		copy(sorted, m.requestTimes)
+		sort.Slice(sorted, func(i, j int) bool {
+			return sorted[i] < sorted[j]
+		})
+
+		stats.P95Latency = percentileOfSorted(sorted, 95)
+		stats.P99Latency = percentileOfSorted(sorted, 99)
 	}
 	
 	if len(m.ttftTimes) > 0 {
@@ -149,11 +173,8 @@ func (m *Metrics) GetStats() MetricsStats {
 	
 	// Calculate token rates
 	if duration.Seconds() > 0 {
-		totalInputTokens := m.sumInts(m.inputTokens)
-		totalOutputTokens := m.sumInts(m.outputTokens)
-		
-		stats.InputTokensPerSec = float64(totalInputTokens) / duration.Seconds()
-		stats.OutputTokensPerSec = float64(totalOutputTokens) / duration.Seconds()
+		stats.InputTokensPerSec = float64(m.totalInputTokens) / duration.Seconds()
+		stats.OutputTokensPerSec = float64(m.totalOutputTokens) / duration.Seconds()
 		stats.TokensPerSec = stats.InputTokensPerSec + stats.OutputTokensPerSec
 	}
 	
@@ -183,7 +204,7 @@ func (m *Metrics) GetCurrentTokensPerSec() float64 {
 		return 0
 	}
 	
-	totalTokens := m.sumInts(m.inputTokens) + m.sumInts(m.outputTokens)
+	totalTokens := m.totalInputTokens + m.totalOutputTokens
 	return float64(totalTokens) / duration.Seconds()
 }
 
@@ -202,62 +223,18 @@ func (m *Metrics) calculateAverage(durations []time.Duration) time.Duration {
 	return time.Duration(total / int64(len(durations)))
 }
 
-func (m *Metrics) calculateMin(durations []time.Duration) time.Duration {
-	if len(durations) == 0 {
-		return 0
-	}
-	
-	min := durations[0]
-	for _, d := range durations[1:] {
-		if d < min {
-			min = d
-		}
-	}
-	
-	return min
-}
-
-func (m *Metrics) calculateMax(durations []time.Duration) time.Duration {
-	if len(durations) == 0 {
+// percentileOfSorted returns the given percentile from an ascending-sorted slice
+func percentileOfSorted(sorted []time.Duration, percentile int) time.Duration {
+	if len(sorted) == 0 {
 		return 0
 	}
-	
-	max := durations[0]
-	for _, d := range durations[1:] {
-		if d > max {
-			max = d
-		}
-	}
-	
-	return max
-}
 
-func (m *Metrics) calculatePercentile(durations []time.Duration, percentile int) time.Duration {
-	if len(durations) == 0 {
-		return 0
-	}
-	
-	// Make a copy and sort it
-	sorted := make([]time.Duration, len(durations))
-	copy(sorted, durations)
-	sort.Slice(sorted, func(i, j int) bool {
-		return sorted[i] < sorted[j]
-	})
-	
 	index := int(float64(len(sorted)) * float64(percentile) / 100.0)
 	if index >= len(sorted) {
 		index = len(sorted) - 1
 	}
-	
-	return sorted[index]
-}
 
-func (m *Metrics) sumInts(values []int) int {
-	sum := 0
-	for _, v := range values {
-		sum += v
-	}
-	return sum
+	return sorted[index]
 }
 
 // LiveMetrics provides thread-safe access to current metrics for display
@@ -289,7 +266,7 @@ func (lm *LiveMetrics) GetLiveStats() (float64, float64, int64, int64, time.Dura
 	
 	if duration.Seconds() > 0 {
 		rps = float64(lm.metrics.successfulRequests) / duration.Seconds()
-		totalTokens := lm.metrics.sumInts(lm.metrics.inputTokens) + lm.metrics.sumInts(lm.metrics.outputTokens)
+		totalTokens := lm.metrics.totalInputTokens + lm.metrics.totalOutputTokens
 		tps = float64(totalTokens) / duration.Seconds()
 	}
 	
@@ -297,7 +274,7 @@ func (lm *LiveMetrics) GetLiveStats() (float64, float64, int64, int64, time.Dura
 	now := time.Now()
 	if now.Sub(lm.lastTime) >= 1*time.Second {
 		currentReqs := lm.metrics.successfulRequests
-		currentTokens := lm.metrics.sumInts(lm.metrics.inputTokens) + lm.metrics.sumInts(lm.metrics.outputTokens)
+		currentTokens := lm.metrics.totalInputTokens + lm.metrics.totalOutputTokens
 		timeDiff := now.Sub(lm.lastTime).Seconds()
 		
 		if timeDiff > 0 {
@@ -0,0 +1,45 @@
+package main
+
+import (
+	"encoding/json"
+	"os"
+	"sync"
+)
+
+// resultWriter appends benchmark results to a file as JSON lines, flushing
+// after every result so an interrupted run keeps everything finished so far
+type resultWriter struct {
+	mu   sync.Mutex
+	file *os.File
+	enc  *json.Encoder
+}
+
+// newResultWriter opens (or creates) the output file for appending
+func newResultWriter(path string) (*resultWriter, error) {
+	file, err := os.OpenFile(path, os.O_CREATE|os.O_WRONLY|os.O_APPEND, 0644)
+	if err != nil {
+		return nil, err
+	}
+
+	return &resultWriter{
+		file: file,
+		enc:  json.NewEncoder(file),
+	}, nil
+}
+
+// Write appends one result as a JSON line and syncs it to disk
+func (w *resultWriter) Write(result BenchmarkResult) error {
+	w.mu.Lock()
+	defer w.mu.Unlock()
+
+	if err := w.enc.Encode(result); err != nil {
+		return err
+	}
+
+	return w.file.Sync()
+}
+
+// Close closes the underlying file
+func (w *resultWriter) Close() error {
+	return w.file.Close()
+}